@@ -325,8 +325,11 @@ const AirDashboard = () => {
                 const calculateRangeAverage = (data, range) => {
                     if (!data || data.length === 0) return NaN;
 
-                    // Sort data by date
-                    const sortedData = [...data].sort((a, b) => new Date(a.date) - new Date(b.date));
+                    // Sort data by date, parsing each date once rather than per comparison
+                    const sortedData = data
+                        .map(item => ({ item, time: new Date(item.date).getTime() }))
+                        .sort((a, b) => a.time - b.time)
+                        .map(({ item }) => item);
 
                     switch (range) {
                         case 'hour':
@@ -309,9 +309,10 @@ const SoilQualityByDate = () => {
         const averageColor = getColor(averageValue, metric);
 
         // Sort the filtered data chronologically by timestamp
-        const sortedData = [...filteredData].sort((a, b) =>
-            new Date(a.timestamp).getTime() - new Date(b.timestamp).getTime()
-        );
+        const sortedData = filteredData
+            .map(item => ({ item, time: new Date(item.timestamp).getTime() }))
+            .sort((a, b) => a.time - b.time)
+            .map(({ item }) => item);
 
         // Create arrays for labels, data points, and colors in the same order
         const chartData = sortedData.map(item => {
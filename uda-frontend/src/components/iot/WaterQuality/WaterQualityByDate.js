@@ -290,12 +290,12 @@ const WaterQualityByDate = () => {
     const getFilteredData = (data) => {
         const selectedHourUTC = parseInt(selectedHour);
 
+        // Parse each timestamp once instead of on every filter/sort comparison
         const filteredAndSorted = data
-            .filter((item) => {
-                const itemDate = new Date(item.timestamp);
-                return itemDate.getUTCHours() === selectedHourUTC;
-            })
-            .sort((a, b) => new Date(a.timestamp) - new Date(b.timestamp)); // Sort by timestamp
+            .map((item) => ({ item, itemDate: new Date(item.timestamp) }))
+            .filter(({ itemDate }) => itemDate.getUTCHours() === selectedHourUTC)
+            .sort((a, b) => a.itemDate - b.itemDate) // Sort by timestamp
+            .map(({ item }) => item);
 
         return filteredAndSorted;
     };